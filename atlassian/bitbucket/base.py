@@ -15,6 +15,8 @@ class BitbucketBase(AtlassianRestAPI):
     CONF_TIMEFORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
     bulk_headers = {"Content-Type": "application/vnd.atl.bitbucket.bulk+json"}
 
+    __slots__ = ("__data", "__times", "timeformat_lambda")
+
     def __init__(self, url, *args, **kwargs):
         """
         Init the rest api wrapper
@@ -156,20 +158,29 @@ class BitbucketBase(AtlassianRestAPI):
 
         :return: The time with the configured format, see timeformat_lambda.
         """
-        value_str = self.get_data(id)
         if self.timeformat_lambda is None:
-            return value_str
+            return self.get_data(id)
 
+        # The parsed values are cached until the data is updated
+        if id in self.__times:
+            return self.timeformat_lambda(self.__times[id])
+
+        value_str = self.get_data(id)
         if isinstance(value_str, str):
-            # The format contains a : in the timezone which is supported from 3.7 on.
-            if sys.version_info <= (3, 7):
-                value_str = RE_TIMEZONE.sub(r"\1\2", value_str)
             try:
-                value = datetime.strptime(value_str, self.CONF_TIMEFORMAT)
-            except ValueError:
-                value = datetime.strptime(value_str, "%Y-%m-%dT%H:%M:%S.%fZ", tzinfo="UTC")
+                # Much faster than strptime and handles the "Z" suffix from Python 3.11 on
+                value = datetime.fromisoformat(value_str)
+            except (AttributeError, ValueError):
+                # The format contains a : in the timezone which is supported from 3.7 on.
+                if sys.version_info <= (3, 7):
+                    value_str = RE_TIMEZONE.sub(r"\1\2", value_str)
+                try:
+                    value = datetime.strptime(value_str, self.CONF_TIMEFORMAT)
+                except ValueError:
+                    value = datetime.strptime(value_str, "%Y-%m-%dT%H:%M:%S.%fZ", tzinfo="UTC")
         else:
             value = value_str
+        self.__times[id] = value
 
         return self.timeformat_lambda(value)
 
@@ -182,6 +193,7 @@ class BitbucketBase(AtlassianRestAPI):
         :return: The updated object
         """
         self.__data = data
+        self.__times = {}
 
         return self
 
@@ -198,4 +210,5 @@ class BitbucketBase(AtlassianRestAPI):
             api_root=self.api_root,
             api_version=self.api_version,
             timeformat_lambda=self.timeformat_lambda,
+            use_orjson=self.use_orjson,
         )
@@ -1,14 +1,28 @@
 # coding=utf-8
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from ..base import BitbucketBase
 
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from ...request_utils import HTTP2Adapter
 
 log = logging.getLogger(__name__)
 
 
 class BitbucketCloudBase(BitbucketBase):
+    # Connection pool used for the session owned by the root object, so all
+    # derived objects reuse the keep-alive connections to the api.
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 50
+    POOL_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+
+    __slots__ = ()
+
     def __init__(self, url, *args, **kwargs):
         """
         Init the rest api wrapper
@@ -16,14 +30,48 @@ class BitbucketCloudBase(BitbucketBase):
         :param url: string:    The base url used for the rest api.
         :param *args: list:    The fixed arguments for the AtlassianRestApi.
         :param **kwargs: dict: The keyword arguments for the AtlassianRestApi.
+                               http2: bool (default is False): If True, the requests are sent with httpx
+                               over HTTP/2 (requires the httpx[http2] extra). Only used if no session is given.
 
         :return: nothing
         """
         expected_type = kwargs.pop("expected_type", None)
+        http2 = kwargs.pop("http2", False)
+        own_session = kwargs.get("session") is None
         super(BitbucketCloudBase, self).__init__(url, *args, **kwargs)
+        if own_session:
+            # Objects created with _new_session_args share this session and its pool
+            if http2:
+                if self.proxies:
+                    raise ValueError("Proxies aren't supported together with http2")
+                if kwargs.get("backoff_and_retry"):
+                    raise ValueError("backoff_and_retry isn't supported together with http2")
+                self._session.mount("https://", HTTP2Adapter(verify=self.verify_ssl, cert=self.cert))
+            else:
+                self._session.mount("https://", self._pool_adapter(self.POOL_RETRIES))
+                # backoff_and_retry mounts an adapter on the url, which takes precedence over "https://".
+                # Keep its retries, but with the same pool settings.
+                backoff_adapter = self._session.adapters.get(self.url)
+                if backoff_adapter is not None:
+                    self._session.mount(self.url, self._pool_adapter(backoff_adapter.max_retries))
         if expected_type is not None and not expected_type == self.get_data("type"):
             raise ValueError("Expected type of data is [{}], got [{}].".format(expected_type, self.get_data("type")))
 
+    def _pool_adapter(self, max_retries):
+        """
+        Get an HTTPAdapter with the connection pool settings of this class.
+
+        :param max_retries: Retry: The retry configuration
+
+        :return: The adapter
+        """
+        return HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=max_retries,
+        )
+
     def get_link(self, link):
         """
         Get a link from the data.
@@ -37,6 +85,36 @@ class BitbucketCloudBase(BitbucketBase):
             return None
         return links[link]["href"]
 
+    @staticmethod
+    def _map_concurrent(func, iterable, concurrency=1):
+        """
+        Apply a function to each element, running up to concurrency calls in parallel.
+
+        The calls share the session (and its connection pool) of the calling object.
+        The iterable is consumed lazily, so a paged generator is only read as far as needed.
+
+        :param func: callable:                  The function to call for each element
+        :param iterable: iterable:              The elements
+        :param concurrency: int (default is 1): The number of parallel calls, 1 runs sequentially
+
+        :return: A generator for the results in the order of the elements
+        """
+        if concurrency is None or concurrency <= 1:
+            for item in iterable:
+                yield func(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque()
+            for item in iterable:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+        return
+
     def _get_paged(
         self,
         url,
@@ -36,23 +36,38 @@ class Participant(BitbucketCloudBase):
     ROLE_PARTICIPANT = "PARTICIPANT"
     CHANGES_REQUESTED = "changes_requested"
 
+    __slots__ = ("_d",)
+
     def __init__(self, data, *args, **kwargs):
         super(Participant, self).__init__(None, None, *args, data=data, expected_type="participant", **kwargs)
 
+    def _update_data(self, data):
+        """
+        Internal function to update the data and the attributes read by the properties.
+
+        :param data: dict: The new data.
+
+        :return: The updated object
+        """
+        super(Participant, self)._update_data(data)
+        self._d = data
+
+        return self
+
     @property
     def user(self):
         """User object with user information of the participant."""
-        return User(None, self.get_data("user"), **self._new_session_args)
+        return User(None, self._d.get("user"), **self._new_session_args)
 
     @property
     def is_participant(self):
         """True if the user is a pull request participant."""
-        return self.get_data("role") == self.ROLE_PARTICIPANT
+        return self._d.get("role") == self.ROLE_PARTICIPANT
 
     @property
     def is_reviewer(self):
         """True if the user is a pull request reviewer."""
-        return self.get_data("role") == self.ROLE_REVIEWER
+        return self._d.get("role") == self.ROLE_REVIEWER
 
     @property
     def is_default_reviewer(self):
@@ -61,12 +76,12 @@ class Participant(BitbucketCloudBase):
     @property
     def has_changes_requested(self):
         """True if user requested changes."""
-        return str(self.get_data("state")) == self.CHANGES_REQUESTED
+        return str(self._d.get("state")) == self.CHANGES_REQUESTED
 
     @property
     def has_approved(self):
         """True if user approved the pull request."""
-        return self.get_data("approved")
+        return self._d.get("approved")
 
     @property
     def participated_on(self):
@@ -76,4 +91,4 @@ class Participant(BitbucketCloudBase):
     @property
     def avatar(self):
         """URL to user avatar on Bitbucket Cloud"""
-        return self.get_data("links")["avatar"]["href"]
+        return self._d["links"]["avatar"]["href"]
@@ -1,5 +1,12 @@
 # coding=utf-8
 
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from requests import ConnectionError, HTTPError, RequestException, Timeout
+
 from ..base import BitbucketCloudBase
 from .diffstat import DiffStat
 from ...cloud.repositories.commits import Commit
@@ -7,17 +14,69 @@ from ..common.builds import Build
 from ..common.comments import Comment
 from ..common.users import User, Participant
 
+log = logging.getLogger(__name__)
+
+
+class NotOpenError(RuntimeError):
+    """Raised when an action needs an open pull request."""
+
+
+class InvalidMergeStrategyError(ValueError):
+    """Raised when merging with a merge strategy Bitbucket doesn't know."""
+
 
 class PullRequests(BitbucketCloudBase):
     """
     Bitbucket Cloud pull requests
     """
 
+    CACHE_MAXSIZE = 1024
+    # Cache of get() shared by all instances: (session, url, id) -> (timestamp, PullRequest)
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(self, url, *args, **kwargs):
+        """
+        Init the pull requests endpoint
+
+        :param url: string:                  The url of the pull requests endpoint.
+        :param cache_ttl: int (default is 0): Seconds a pull request returned by get() is reused,
+                                              0 disables the cache.
+        :param cache_fallback: bool (default is False): If True, get() returns the last cached pull request,
+                                                        even if expired, when Bitbucket is unreachable.
+        """
+        self.cache_ttl = kwargs.pop("cache_ttl", 0)
+        self.cache_fallback = kwargs.pop("cache_fallback", False)
         super(PullRequests, self).__init__(url, *args, **kwargs)
+        # The url doesn't change, so the pull request urls are built by concatenation
+        self._url_prefix = self.url.rstrip("/") + "/"
 
     def __get_object(self, data):
-        return PullRequest(data, **self._new_session_args)
+        pr = PullRequest(data, **self._new_session_args)
+        pr._cache_key = self._cache_key_for(pr.id)
+        return pr
+
+    def _cache_key_for(self, pr_id):
+        """
+        Get the key of a pull request in the cache of get().
+        The session is part of the key, so clients with different credentials never share objects.
+        A cached PullRequest keeps its session alive, so the session id can't be reused meanwhile.
+
+        :param pr_id: int: The pull request id
+
+        :return: The cache key
+        """
+        return (id(self._session), self.url, str(pr_id))
+
+    @classmethod
+    def _cache_invalidate(cls, key):
+        """
+        Remove a pull request from the cache of get().
+
+        :param key: tuple: The cache key of the pull request
+        """
+        with cls._cache_lock:
+            cls._cache.pop(key, None)
 
     def create(
         self,
@@ -55,9 +114,11 @@ class PullRequests(BitbucketCloudBase):
         if destination_branch:
             data["destination"] = {"branch": {"name": destination_branch}}
 
-        return self.__get_object(self.post(None, data))
+        pr = self.__get_object(self.post(None, data))
+        self._cache_invalidate(pr._cache_key)
+        return pr
 
-    def each(self, q=None, sort=None):
+    def each(self, q=None, sort=None, concurrency=1, fields=None):
         """
         Returns the list of pull requests in this repository.
 
@@ -65,6 +126,13 @@ class PullRequests(BitbucketCloudBase):
                           See https://developer.atlassian.com/bitbucket/api/2/reference/meta/filtering for details.
         :param sort: string: Name of a response property to sort results.
                              See https://developer.atlassian.com/bitbucket/api/2/reference/meta/filtering for details.
+        :param concurrency: int: Number of pull requests fetched in parallel, default is 1 (sequential).
+                                 The order of the returned pull requests is kept.
+        :param fields: string: Comma separated pull request fields, e.g. "id,title,state,author".
+                               If set, the pull requests are built from the paged response restricted to
+                               these fields instead of being fetched one by one. Properties of omitted
+                               fields return None (or raise for nested ones like source_branch).
+                               See https://developer.atlassian.com/cloud/bitbucket/rest/intro/#partial-response
 
         :return: A generator for the PullRequest objects
 
@@ -75,8 +143,18 @@ class PullRequests(BitbucketCloudBase):
             params["sort"] = sort
         if q is not None:
             params["q"] = q
-        for pr in self._get_paged(None, trailing=True, params=params):
-            yield self.__get_object(super(PullRequests, self).get(pr.get("id")))
+        if fields is None:
+            # Each pull request is fetched on its own, only the id is needed from the list
+            params["fields"] = "next,values.id"
+            prs = self._get_paged(None, trailing=True, params=params)
+            for pr in self._map_concurrent(lambda x: self.get(x.get("id")), prs, concurrency):
+                yield pr
+        else:
+            # type and self link are needed to create the PullRequest objects
+            fields = ["type", "links.self"] + [x.strip() for x in fields.split(",") if x.strip()]
+            params["fields"] = ",".join(["next"] + ["values." + x for x in fields])
+            for pr in self._get_paged(None, trailing=True, params=params):
+                yield self.__get_object(pr)
 
         return
 
@@ -90,7 +168,92 @@ class PullRequests(BitbucketCloudBase):
 
         API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D#get
         """
-        return self.__get_object(super(PullRequests, self).get(id))
+        if not self.cache_ttl and not self.cache_fallback:
+            return self.__get_object(super(PullRequests, self).get(self._url_prefix + str(id), absolute=True))
+
+        key = self._cache_key_for(id)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                self._cache.move_to_end(key)
+                return cached[1]
+
+        try:
+            pr = self.__get_object(super(PullRequests, self).get(self._url_prefix + str(id), absolute=True))
+        except (ConnectionError, Timeout, HTTPError) as e:
+            unavailable = not isinstance(e, HTTPError) or e.response is None or e.response.status_code >= 500
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if not (self.cache_fallback and unavailable and cached is not None):
+                raise
+            log.warning("Serving pull request [%s] cached %.0f seconds ago: %s", id, time.monotonic() - cached[0], e)
+            return cached[1]
+
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), pr)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        return pr
+
+    def participants_bulk(self, ids, concurrency=8):
+        """
+        Returns the participants of several pull requests in this repository.
+
+        :param ids: list: The requested pull request ids
+        :param concurrency: int: Number of pull requests fetched in parallel, default is 8.
+
+        :return: A dict mapping each pull request id to the list of its Participant objects
+        """
+        ids = list(ids)
+        prs = self._map_concurrent(self.get, ids, concurrency)
+        return {id: pr.participants() for id, pr in zip(ids, prs)}
+
+    def _post_action(self, id, action, data):
+        """
+        Post to an action endpoint of a pull request.
+
+        :param id: int: The pull request id
+        :param action: string: The action endpoint, e.g. "approve"
+        :param data: dict: The data to post
+
+        :return: The response or, if the request failed, the raised exception
+        """
+        try:
+            response = self.post(self._url_prefix + str(id) + "/" + action, data, absolute=True)
+        except RequestException as e:
+            return e
+        self._cache_invalidate(self._cache_key_for(id))
+        return response
+
+    def approve_many(self, ids, concurrency=8):
+        """
+        Approves several pull requests in this repository.
+        A failing request doesn't stop the others, its exception is returned instead of the response.
+
+        :param ids: list: The pull request ids
+        :param concurrency: int: Number of requests sent in parallel, default is 8.
+
+        :return: A list with the response or the raised exception for each id
+
+        API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D/approve#post
+        """
+        data = {"approved": True}
+        return list(self._map_concurrent(lambda id: self._post_action(id, "approve", data), ids, concurrency))
+
+    def decline_many(self, ids, concurrency=8):
+        """
+        Declines several pull requests in this repository.
+        A failing request doesn't stop the others, its exception is returned instead of the response.
+
+        :param ids: list: The pull request ids
+        :param concurrency: int: Number of requests sent in parallel, default is 8.
+
+        :return: A list with the response or the raised exception for each id
+
+        API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D/decline
+        """
+        return list(self._map_concurrent(lambda id: self._post_action(id, "decline", {"id": id}), ids, concurrency))
 
 
 class PullRequest(BitbucketCloudBase):
@@ -103,58 +266,94 @@ class PullRequest(BitbucketCloudBase):
     MERGE_COMMIT = "merge_commit"
     MERGE_SQUASH = "squash"
     MERGE_FF = "fast_forward"
-    MERGE_STRATEGIES = [
+    MERGE_STRATEGIES_LIST = [
         MERGE_COMMIT,
         MERGE_SQUASH,
         MERGE_FF,
     ]
+    MERGE_STRATEGIES = frozenset(MERGE_STRATEGIES_LIST)
+    _INVALID_MERGE_STRATEGY_MSG = "merge_strategy must be one of {}".format(MERGE_STRATEGIES_LIST)
     STATE_OPEN = "OPEN"
     STATE_DECLINED = "DECLINED"
     STATE_MERGED = "MERGED"
     STATE_SUPERSEDED = "SUPERSEDED"
 
+    # Slotted like its base classes, so the many PullRequest objects have no __dict__
+    __slots__ = ("_d", "_state", "_source", "_dest", "_cache_key")
+
     def __init__(self, data, *args, **kwargs):
+        # Key in the PullRequests.get() cache, set by PullRequests for the objects it creates
+        self._cache_key = None
         super(PullRequest, self).__init__(None, *args, data=data, expected_type="pullrequest", **kwargs)
 
+    def _update_data(self, data):
+        """
+        Internal function to update the data and the attributes read by the properties.
+
+        :param data: dict: The new data.
+
+        :return: The updated object
+        """
+        super(PullRequest, self)._update_data(data)
+        self._d = data
+        self._state = data.get("state")
+        self._source = data.get("source") or {}
+        self._dest = data.get("destination") or {}
+
+        return self
+
     def _check_if_open(self):
-        if not self.is_open:
-            raise Exception("Pull Request isn't open")
+        if self._state != self.STATE_OPEN:
+            raise NotOpenError("Pull Request isn't open")
         return
 
+    def _update_from_response(self, response):
+        """
+        Update the data with the pull request returned by a state changing request.
+
+        :param response: dict: The response of the request
+        """
+        if isinstance(response, dict) and response.get("type") == "pullrequest":
+            self._update_data(response)
+
+    def _invalidate_cache(self):
+        """Drop this pull request from the PullRequests.get() cache after a modification."""
+        PullRequests._cache_invalidate(self._cache_key)
+
     @property
     def id(self):
         """unique pull request id"""
-        return self.get_data("id")
+        return self._d.get("id")
 
     @property
     def title(self):
         """pull request title"""
-        return self.get_data("title")
+        return self._d.get("title")
 
     @property
     def description(self):
         """pull request description"""
-        return self.get_data("description")
+        return self._d.get("description")
 
     @property
     def is_declined(self):
         """True if the pull request was declined"""
-        return self.get_data("state") == self.STATE_DECLINED
+        return self._state == self.STATE_DECLINED
 
     @property
     def is_merged(self):
         """True if the pull request was merged"""
-        return self.get_data("state") == self.STATE_MERGED
+        return self._state == self.STATE_MERGED
 
     @property
     def is_open(self):
         """True if the pull request is open"""
-        return self.get_data("state") == self.STATE_OPEN
+        return self._state == self.STATE_OPEN
 
     @property
     def is_superseded(self):
         """True if the pull request was superseded"""
-        return self.get_data("state") == self.STATE_SUPERSEDED
+        return self._state == self.STATE_SUPERSEDED
 
     @property
     def created_on(self):
@@ -169,47 +368,47 @@ class PullRequest(BitbucketCloudBase):
     @property
     def close_source_branch(self):
         """close source branch flag"""
-        return self.get_data("close_source_branch")
+        return self._d.get("close_source_branch")
 
     @property
     def source_branch(self):
         """source branch"""
-        return self.get_data("source")["branch"]["name"]
+        return self._source["branch"]["name"]
 
     @property
     def destination_branch(self):
         """destination branch"""
-        return self.get_data("destination")["branch"]["name"]
+        return self._dest["branch"]["name"]
 
     @property
     def source_commit(self):
         """Source commit."""
-        return self.get_data("source")["commit"]["hash"]
+        return self._source["commit"]["hash"]
 
     @property
     def destination_commit(self):
         """Destination commit."""
-        return self.get_data("destination")["commit"]["hash"]
+        return self._dest["commit"]["hash"]
 
     @property
     def comment_count(self):
         """number of comments"""
-        return self.get_data("comment_count")
+        return self._d.get("comment_count")
 
     @property
     def task_count(self):
         """number of tasks"""
-        return self.get_data("task_count")
+        return self._d.get("task_count")
 
     @property
     def declined_reason(self):
         """reason for declining"""
-        return self.get_data("reason")
+        return self._d.get("reason")
 
     @property
     def author(self):
         """User object of the author"""
-        return User(None, self.get_data("author"))
+        return User(None, self._d.get("author"), **self._new_session_args)
 
     @property
     def has_conflict(self):
@@ -255,18 +454,14 @@ class PullRequest(BitbucketCloudBase):
         return self._get_paged("statuses")
 
     def participants(self):
-        """Returns a generator object of participants"""
-        for participant in self.get_data("participants"):
-            yield Participant(participant, **self._new_session_args)
-
-        return
+        """Returns a list of participants"""
+        session_args = self._new_session_args
+        return [Participant(participant, **session_args) for participant in self._d.get("participants")]
 
     def reviewers(self):
-        """Returns a generator object of reviewers"""
-        for reviewer in self.get_data("reviewers"):
-            yield User(None, reviewer, **self._new_session_args)
-
-        return
+        """Returns a list of reviewers"""
+        session_args = self._new_session_args
+        return [User(None, reviewer, **session_args) for reviewer in self._d.get("reviewers")]
 
     def builds(self):
         """Returns the latest Build objects for the pull request."""
@@ -310,7 +505,9 @@ class PullRequest(BitbucketCloudBase):
             }
         }
 
-        return self.post("comments", data)
+        response = self.post("comments", data)
+        self._invalidate_cache()
+        return response
 
     @property
     def commits(self):
@@ -354,7 +551,9 @@ class PullRequest(BitbucketCloudBase):
         """
         self._check_if_open()
         data = {"approved": True}
-        return self.post("approve", data)
+        response = self.post("approve", data)
+        self._invalidate_cache()
+        return response
 
     def unapprove(self):
         """
@@ -363,7 +562,9 @@ class PullRequest(BitbucketCloudBase):
         API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D/approve#delete
         """
         self._check_if_open()
-        return super(BitbucketCloudBase, self).delete("approve")
+        response = super(BitbucketCloudBase, self).delete("approve")
+        self._invalidate_cache()
+        return response
 
     def request_changes(self):
         """
@@ -373,7 +574,9 @@ class PullRequest(BitbucketCloudBase):
         """
         self._check_if_open()
         data = {"request-changes": True}
-        return self.post("request-changes", data)
+        response = self.post("request-changes", data)
+        self._invalidate_cache()
+        return response
 
     def unrequest_changes(self):
         """
@@ -382,7 +585,9 @@ class PullRequest(BitbucketCloudBase):
         API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D/request-changes#delete
         """
         self._check_if_open()
-        return super(BitbucketCloudBase, self).delete("request-changes")
+        response = super(BitbucketCloudBase, self).delete("request-changes")
+        self._invalidate_cache()
+        return response
 
     def decline(self):
         """
@@ -393,27 +598,34 @@ class PullRequest(BitbucketCloudBase):
         self._check_if_open()
         # decline endpoint needs data, but it's not possible to set a decline reason by api (frontend only)
         data = {"id": self.id}
-        return self.post("decline", data)
+        response = self.post("decline", data)
+        self._update_from_response(response)
+        self._invalidate_cache()
+        return response
 
     def merge(self, merge_strategy=None, close_source_branch=None):
         """
         Merges the pull request if it's open
         :param merge_strategy: string:  Merge strategy (one of PullRequest.MERGE_COMMIT, PullRequest.MERGE_SQUASH, PullRequest.MERGE_FF), if None default merge strategy will be used
-        :param close_source_branch: boolean: Close the source branch after merge, default PR option
+        :param close_source_branch: boolean: Close the source branch after merge, if None the PR option is used
 
         API docs: https://developer.atlassian.com/bitbucket/api/2/reference/resource/repositories/%7Bworkspace%7D/%7Brepo_slug%7D/pullrequests/%7Bpull_request_id%7D/merge
         """
-        self._check_if_open()
-
         if merge_strategy is not None and merge_strategy not in self.MERGE_STRATEGIES:
-            raise ValueError("merge_strategy must be {}".format(self.MERGE_STRATEGIES))
+            raise InvalidMergeStrategyError(self._INVALID_MERGE_STRATEGY_MSG)
+        self._check_if_open()
 
+        if close_source_branch is None:
+            close_source_branch = self.close_source_branch
         data = {
-            "close_source_branch": close_source_branch or self.close_source_branch,
+            "close_source_branch": close_source_branch,
             "merge_strategy": merge_strategy,
         }
 
-        return self.post("merge", data)
+        response = self.post("merge", data)
+        self._update_from_response(response)
+        self._invalidate_cache()
+        return response
 
 
 class Task(BitbucketCloudBase):
@@ -1,5 +1,9 @@
 import logging
 
+from requests import ConnectionError, Response, Timeout
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from six import PY3
 
 
@@ -37,3 +41,61 @@ def get_default_logger(name):
         # StreamHandler on Python 3
         logger.addHandler(logging.NullHandler())
     return logger
+
+
+class HTTP2Adapter(BaseAdapter):
+    """Transport adapter sending the requests of a requests.Session with httpx over HTTP/2.
+
+    All requests share one httpx.Client, so concurrent requests to the same host are
+    multiplexed over a single TLS connection. Requires the httpx[http2] extra.
+    """
+
+    def __init__(self, verify=True, cert=None, max_connections=100, max_keepalive_connections=20, timeout=30.0):
+        super(HTTP2Adapter, self).__init__()
+        import httpx
+
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            verify=verify,
+            cert=cert,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout,
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a PreparedRequest, verify and cert are taken from the client configuration."""
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is None:
+            timeout = self._client.timeout
+        try:
+            result = self._client.request(
+                request.method,
+                request.url,
+                headers=list(request.headers.items()),
+                content=request.body,
+                timeout=timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise ConnectionError(e, request=request)
+
+        response = Response()
+        response.status_code = result.status_code
+        response.headers = CaseInsensitiveDict(result.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = result.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = result.content
+        response._content_consumed = True
+        for cookie in result.cookies.jar:
+            response.cookies.set_cookie(cookie)
+        return response
+
+    def close(self):
+        self._client.close()
@@ -17,9 +17,32 @@ import urllib3
 
 from atlassian.request_utils import get_default_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = get_default_logger(__name__)
 
 
+def _response_json(response, use_orjson=False):
+    """
+    Decode the json body of a response.
+    With use_orjson the raw bytes are parsed by orjson, else by the stdlib decoder of requests.
+    Note: orjson parses integers exceeding 64 bit as float.
+    :param response:
+    :param use_orjson: bool, OPTIONAL: Decode with orjson
+    :return:
+    """
+    if use_orjson:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, let the more lenient stdlib decoder handle (or reject) it
+            pass
+    return response.json()
+
+
 class AtlassianRestAPI(object):
     default_headers = {
         "Content-Type": "application/json",
@@ -45,6 +68,24 @@ class AtlassianRestAPI(object):
     }
     response = None
 
+    # Subclasses without __slots__ still get a __dict__, this allows fully slotted data objects
+    __slots__ = (
+        "url",
+        "username",
+        "password",
+        "timeout",
+        "verify_ssl",
+        "api_root",
+        "api_version",
+        "cookies",
+        "advanced_mode",
+        "cloud",
+        "proxies",
+        "cert",
+        "use_orjson",
+        "_session",
+    )
+
     def __init__(
         self,
         url,
@@ -68,6 +109,7 @@ class AtlassianRestAPI(object):
         retry_status_codes=[413, 429, 503],
         max_backoff_seconds=1800,
         max_backoff_retries=1000,
+        use_orjson=False,
     ):
         """
         init function for the AtlassianRestAPI object.
@@ -101,6 +143,8 @@ class AtlassianRestAPI(object):
                 wait any longer than this. Defaults to 1800.
         :param max_backoff_retries: Maximum number of retries to try before
                 continuing. Defaults to 1000.
+        :param use_orjson: Decode json responses with orjson (pip install atlassian-python-api[orjson]).
+                It is faster, but parses integers exceeding 64 bit as float. Defaults to False.
         """
         self.url = url
         self.username = username
@@ -114,6 +158,9 @@ class AtlassianRestAPI(object):
         self.cloud = cloud
         self.proxies = proxies
         self.cert = cert
+        if use_orjson and orjson is None:
+            raise ImportError("use_orjson requires the orjson package")
+        self.use_orjson = use_orjson
         if session is None:
             self._session = requests.Session()
         else:
@@ -194,9 +241,9 @@ class AtlassianRestAPI(object):
         self._session.headers.update({key: value})
 
     @staticmethod
-    def _response_handler(response):
+    def _response_handler(response, use_orjson=False):
         try:
-            return response.json()
+            return _response_json(response, use_orjson)
         except ValueError:
             log.debug("Received response with no content")
             return None
@@ -306,7 +353,9 @@ class AtlassianRestAPI(object):
         response.encoding = "utf-8"
 
         log.debug("HTTP: %s %s -> %s %s", method, path, response.status_code, response.reason)
-        log.debug("HTTP: Response text -> %s", response.text)
+        if log.isEnabledFor(logging.DEBUG):
+            # Decoding the text is expensive for large responses, only do it when it's logged
+            log.debug("HTTP: Response text -> %s", response.text)
         if self.advanced_mode or advanced_mode:
             return response
 
@@ -354,10 +403,10 @@ class AtlassianRestAPI(object):
         if not_json_response:
             return response.content
         else:
-            if not response.text:
+            if not response.content:
                 return None
             try:
-                return response.json()
+                return _response_json(response, self.use_orjson)
             except Exception as e:
                 log.error(e)
                 return response.text
@@ -400,7 +449,7 @@ class AtlassianRestAPI(object):
         )
         if self.advanced_mode or advanced_mode:
             return response
-        return self._response_handler(response)
+        return self._response_handler(response, self.use_orjson)
 
     def put(
         self,
@@ -437,7 +486,7 @@ class AtlassianRestAPI(object):
         )
         if self.advanced_mode or advanced_mode:
             return response
-        return self._response_handler(response)
+        return self._response_handler(response, self.use_orjson)
 
     """
         Partial modification of resource by PATCH Method
@@ -479,7 +528,7 @@ class AtlassianRestAPI(object):
         )
         if self.advanced_mode or advanced_mode:
             return response
-        return self._response_handler(response)
+        return self._response_handler(response, self.use_orjson)
 
     def delete(
         self,
@@ -517,7 +566,7 @@ class AtlassianRestAPI(object):
         )
         if self.advanced_mode or advanced_mode:
             return response
-        return self._response_handler(response)
+        return self._response_handler(response, self.use_orjson)
 
     def raise_for_status(self, response):
         """
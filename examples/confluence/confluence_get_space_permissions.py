@@ -1,5 +1,6 @@
 # coding=utf-8
 import logging
+import os
 from pprint import pprint
 
 from atlassian import Confluence
@@ -8,7 +9,8 @@ CONFLUENCE_URL = "http://conlfuence.example.com"
 CONFLUENCE_LOGIN = "gonchik.tsymzhitov"
 CONFLUENCE_PASSWORD = "************"
 
-logging.basicConfig(level=logging.DEBUG)
+# DEBUG logs every request and response body, only enable it for troubleshooting, e.g. LOGLEVEL=DEBUG
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
 
 confluence = Confluence(
     url=CONFLUENCE_URL,
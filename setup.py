@@ -27,7 +27,7 @@ setup(
     include_package_data=True,
     zip_safe=False,
     install_requires=["deprecated", "requests", "six", "oauthlib", "requests_oauthlib", "jmespath", "beautifulsoup4"],
-    extras_require={"kerberos": ["requests-kerberos"]},
+    extras_require={"kerberos": ["requests-kerberos"], "orjson": ["orjson"], "http2": ["httpx[http2]"]},
     platforms="Platform Independent",
     classifiers=[
         "Development Status :: 4 - Beta",
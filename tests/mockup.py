@@ -70,6 +70,8 @@ def request_mockup(*args, **kwargs):
         response.status_code = 404  # Not found
         response.reason = "No stub defined for key [{}] in [{}]".format(response_key, response_file)
 
+    # Like a non-streamed requests response, the body is already read
+    response._content_consumed = True
     return response
 
 
@@ -1,7 +1,13 @@
 # coding: utf8
+import math
 import os
 
+import pytest
+from requests import Request, Response
+
 from atlassian import Jira, Confluence, Bitbucket, Bamboo, Crowd, ServiceDesk, Xray
+from atlassian.request_utils import HTTP2Adapter
+from atlassian.rest_client import _response_json
 
 BAMBOO_URL = os.environ.get("BAMBOO_URL", "http://localhost:8085")
 JIRA_URL = os.environ.get("BAMBOO_URL", "http://localhost:8080")
@@ -43,3 +49,34 @@ class TestBasic:
 
     def test_init_xray(self):
         Xray(url=XRAY_URL, username=ATLASSIAN_USER, password=ATLASSIAN_PASSWORD)
+
+    def test_response_json(self):
+        response = Response()
+        response._content = b'{"id": 1, "name": "\xc3\xa4", "big": 123456789012345678901234567890}'
+        expected = {"id": 1, "name": "ä", "big": 123456789012345678901234567890}
+        assert _response_json(response) == expected, "The stdlib decoder is used by default"
+
+        pytest.importorskip("orjson")
+        assert _response_json(response, use_orjson=True)["name"] == "ä"
+        response._content = b'{"value": NaN}'
+        assert math.isnan(_response_json(response, use_orjson=True)["value"])
+
+    def test_http2_adapter(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        def handler(request):
+            assert request.headers["Accept"] == "application/json"
+            assert request.content == b'{"a": 1}'
+            return httpx.Response(201, json={"id": 1}, headers={"Content-Type": "application/json"})
+
+        adapter = HTTP2Adapter()
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        request = Request(
+            "POST", "https://bitbucket.example.com/x", data='{"a": 1}', headers={"Accept": "application/json"}
+        )
+        response = adapter.send(request.prepare(), timeout=5)
+        assert response.status_code == 201
+        assert response.json() == {"id": 1}
+        assert response.headers["content-type"] == "application/json"
+        adapter.close()
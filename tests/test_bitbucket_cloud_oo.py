@@ -3,11 +3,26 @@ from atlassian.bitbucket.cloud.repositories import WorkspaceRepositories
 import pytest
 import sys
 from datetime import datetime
+from unittest import mock
+
+import urllib3
+
+from requests import ConnectionError, HTTPError, Session
 
 from atlassian import Bitbucket
 from atlassian.bitbucket import Cloud
 from atlassian.bitbucket.cloud.common.users import User
-from atlassian.bitbucket.cloud.repositories.pullRequests import Comment, Commit, Participant, PullRequest, Build, Task
+from atlassian.bitbucket.cloud.repositories.pullRequests import (
+    Comment,
+    Commit,
+    InvalidMergeStrategyError,
+    NotOpenError,
+    Participant,
+    PullRequest,
+    PullRequests,
+    Build,
+    Task,
+)
 
 BITBUCKET = None
 try:
@@ -173,6 +188,15 @@ class TestPullRequests:
     def tc2(self):
         return CLOUD.workspaces.get("TestWorkspace1").repositories.get("testrepository1").pullrequests
 
+    @pytest.fixture
+    def cached_tc2(self, tc2):
+        try:
+            yield tc2
+        finally:
+            tc2.cache_ttl = 0
+            tc2.cache_fallback = False
+            PullRequests._cache.clear()
+
     @pytest.fixture(scope="module")
     def tc3(self):
         return CLOUD.workspaces.get("TestWorkspace1").repositories.get("testrepository1").pullrequests.get(1).commits
@@ -204,6 +228,12 @@ class TestPullRequests:
     def test_updated_on(self, tc1):
         assert _datetimetostr(tc1.updated_on) == _datetimetostr(datetime(2020, 12, 27, 14, 9, 14, 660262))
 
+    def test_times_cached(self, tc2):
+        pr = tc2.get(1)
+        assert pr.updated_on is pr.updated_on
+        pr._update_data(dict(pr.data, updated_on="2021-01-02T03:04:05.000006+00:00"))
+        assert _datetimetostr(pr.updated_on) == _datetimetostr(datetime(2021, 1, 2, 3, 4, 5, 6))
+
     def test_close_source_branch(self, tc1):
         assert tc1.close_source_branch
 
@@ -348,19 +378,42 @@ class TestPullRequests:
     def test_unrequest_changes(self, tc1):
         assert tc1.unrequest_changes() is None
 
-    def test_decline(self, tc1):
-        decline = tc1.decline()
+    def test_decline(self, tc2):
+        pr = tc2.get(1)
+        decline = pr.decline()
         assert decline["type"] == "pullrequest"
         assert decline["state"] == PullRequest.STATE_DECLINED
         assert decline["merge_commit"] is None
         assert decline["closed_by"]["uuid"] == "{User04UUID}"
+        assert pr.is_declined
+        with pytest.raises(NotOpenError):
+            pr.approve()
 
-    def test_merge(self, tc1):
-        merge = tc1.merge()
+    def test_merge(self, tc2):
+        pr = tc2.get(1)
+        merge = pr.merge()
         assert merge["type"] == "pullrequest"
         assert merge["state"] == PullRequest.STATE_MERGED
         assert merge["closed_by"]["uuid"] == "{User04UUID}"
         assert merge["merge_commit"]["hash"] == "36bb9607a8c9e0c6222342486e3393ae154b46c0"
+        assert pr.is_merged
+        with pytest.raises(NotOpenError):
+            pr.merge()
+        with pytest.raises(InvalidMergeStrategyError):
+            pr.merge(merge_strategy="rebase")
+
+    def test_merge_keep_source_branch(self, tc2):
+        pr = tc2.get(1)
+        assert pr.close_source_branch
+        with mock.patch.object(PullRequest, "post", return_value=None) as post:
+            pr.merge(close_source_branch=False)
+        post.assert_called_once_with("merge", {"close_source_branch": False, "merge_strategy": None})
+
+    def test_merge_invalid_strategy(self, tc1):
+        assert PullRequest.MERGE_SQUASH in PullRequest.MERGE_STRATEGIES
+        with pytest.raises(InvalidMergeStrategyError):
+            tc1.merge(merge_strategy="rebase")
+        assert issubclass(InvalidMergeStrategyError, ValueError)
 
     def test_each(self, tc2):
         prs = list(tc2.each())
@@ -370,6 +423,104 @@ class TestPullRequests:
         assert prs[1].id == 25
         assert len(list(prs[1].participants())) == 5
 
+    def test_each_fields(self, tc2):
+        prs = list(tc2.each(fields="id,title,state"))
+        assert [pr.id for pr in prs] == [1, 25]
+        assert prs[0].title == "PRTitle"
+        assert prs[0].is_open
+        assert prs[0].description is None
+        assert prs[0].url.endswith("pullrequests/1")
+
+    def test_each_concurrent(self, tc2):
+        prs = list(tc2.each(concurrency=4))
+        assert [pr.id for pr in prs] == [1, 25]
+        assert all(isinstance(pr, PullRequest) for pr in prs)
+
+    def test_participants_bulk(self, tc2):
+        result = tc2.participants_bulk([1, 25])
+        assert sorted(result) == [1, 25]
+        assert len(result[1]) == 5
+        assert all(isinstance(p, Participant) for p in result[25])
+
+    def test_approve_many(self, tc2):
+        result = tc2.approve_many([1, 25])
+        assert result[0]["approved"]
+        assert isinstance(result[1], HTTPError), "No stub for approving pull request 25"
+
+    def test_decline_many(self, tc2):
+        (decline,) = tc2.decline_many([1])
+        assert decline["state"] == PullRequest.STATE_DECLINED
+
+    def test_get_cached(self, cached_tc2):
+        assert cached_tc2.get(1) is not cached_tc2.get(1), "Cache is disabled by default"
+
+        cached_tc2.cache_ttl = 30
+        pr = cached_tc2.get(1)
+        assert cached_tc2.get(1) is pr
+        assert cached_tc2.get("1") is pr
+        pr.approve()
+        assert cached_tc2.get(1) is not pr, "Modification invalidates the cache"
+
+    def test_get_cached_per_session(self, cached_tc2):
+        other = Cloud("{}/bitbucket/cloud".format(mockup_server()), username="bob", password="bobpassword")
+        other_prs = other.workspaces.get("TestWorkspace1").repositories.get("testrepository1").pullrequests
+        cached_tc2.cache_ttl = 30
+        other_prs.cache_ttl = 30
+        pr = cached_tc2.get(1)
+        other_pr = other_prs.get(1)
+        assert other_pr is not pr, "Clients with different sessions don't share cached objects"
+        assert other_pr.session.auth == ("bob", "bobpassword")
+        assert pr.session.auth == ("username", "password")
+
+        third = Cloud("{}/bitbucket/cloud".format(mockup_server()), username="eve", password="evepassword")
+        third_prs = third.workspaces.get("TestWorkspace1").repositories.get("testrepository1").pullrequests
+        third_prs.cache_fallback = True
+        with mock.patch.object(Session, "request", side_effect=ConnectionError("unreachable")):
+            with pytest.raises(ConnectionError):
+                third_prs.get(1)
+
+    def test_get_cache_fallback(self, cached_tc2):
+        pr = cached_tc2.get(25)
+        with mock.patch.object(Session, "request", side_effect=ConnectionError("unreachable")):
+            with pytest.raises(ConnectionError):
+                cached_tc2.get(25)
+
+        cached_tc2.cache_fallback = True
+        pr = cached_tc2.get(25)
+        with mock.patch.object(Session, "request", side_effect=ConnectionError("unreachable")):
+            assert cached_tc2.get(25) is pr
+            with pytest.raises(ConnectionError):
+                cached_tc2.get(1)
+        assert cached_tc2.get(25) is not pr, "Cached pull request is only used on failures"
+
+    @pytest.mark.skipif(int(urllib3.__version__.split(".")[0]) < 2, reason="backoff requires urllib3 2")
+    def test_backoff_and_retry_pool(self):
+        cloud = Cloud(
+            "{}/bitbucket/cloud".format(mockup_server()),
+            username="username",
+            password="password",
+            backoff_and_retry=True,
+        )
+        adapter = cloud.session.get_adapter(cloud.url + "/workspaces")
+        assert adapter._pool_maxsize == 50
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_http2_backoff_and_retry(self):
+        with pytest.raises(ValueError):
+            Cloud("{}/bitbucket/cloud".format(mockup_server()), http2=True, backoff_and_retry=True)
+
+    def test_slots(self, tc1):
+        assert not hasattr(tc1, "__dict__")
+        assert all(not hasattr(p, "__dict__") for p in tc1.participants())
+
+    def test_shared_session(self, tc1, tc2):
+        adapter = CLOUD.session.get_adapter("https://api.bitbucket.org/")
+        assert adapter._pool_maxsize == 50
+        assert tc2.session is CLOUD.session
+        assert tc1.session is CLOUD.session
+        assert tc1.author.session is CLOUD.session
+        assert all(p.session is CLOUD.session for p in tc1.participants())
+
     def test_create(self, tc2):
         reviewers = ["{User04UUID}", "{User02UUID}", "{User01UUID}"]
         pr = tc2.create(